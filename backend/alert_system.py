@@ -5,7 +5,7 @@ from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 import smtplib
 from datetime import datetime
-import pandas as pd
+import numpy as np
 import os
 
 # Import industry standard thresholds
@@ -536,17 +536,10 @@ def process_sensor_data(data):
             "recommendation": "Unable to process - no data points"
         }
 
-    # Create DataFrame
-    df = pd.DataFrame({
-        "temperature": temp[:min_len],
-        "speed": speed[:min_len],
-        "vibration": vibration[:min_len]
-    })
-
-    # Calculate averages
-    avg_temp = df["temperature"].mean()
-    avg_speed = df["speed"].mean()
-    avg_vibration = df["vibration"].mean()
+    # Calculate averages (NaN readings are skipped, as DataFrame.mean did)
+    avg_temp = np.nanmean(np.asarray(temp[:min_len], dtype=float))
+    avg_speed = np.nanmean(np.asarray(speed[:min_len], dtype=float))
+    avg_vibration = np.nanmean(np.asarray(vibration[:min_len], dtype=float))
 
     # Use industry standard threshold analysis
     overall_status = get_overall_status(avg_temp, avg_vibration, avg_speed)
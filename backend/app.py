@@ -18,17 +18,24 @@ from datetime import datetime, timedelta
 from werkzeug.security import generate_password_hash, check_password_hash
 import random
 import smtplib
-from routes.predict import predict_bp
+from routes.predict import predict_bp, load_pickle_cached, load_scaler_cached, lstm_forward, iso_label
 from routes.chatbot import chatbot_bp
 import tensorflow as tf
-import pickle
 import json
 from report_routes import report_bp
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 import pandas as pd
 from email.mime.text import MIMEText
 import threading
+from functools import lru_cache
 from alert_system import process_sensor_data
+from model.feature_utils import create_engineered_features
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; sensor JSON then goes through the stdlib parser
+    orjson = None
 
 
 # ---------------------------
@@ -55,12 +62,12 @@ db = SQLAlchemy(app)
 # ---------------------------
 MODEL_DIR = os.path.join(os.path.dirname(__file__), "model")
 
-def safe_load_pickle(path):
+def safe_load_pickle(path, loader=load_pickle_cached):
     try:
-        with open(path, "rb") as f:
-            obj = pickle.load(f)
-            print(f"✅ Loaded: {os.path.basename(path)}")
-            return obj
+        # Shared cache: routes.predict has already unpickled these at import
+        obj = loader(path)
+        print(f"✅ Loaded: {os.path.basename(path)}")
+        return obj
     except FileNotFoundError:
         print(f"⚠️ File not found: {path}")
         return None
@@ -70,7 +77,7 @@ def safe_load_pickle(path):
 
 iso_model = safe_load_pickle(os.path.join(MODEL_DIR, "iso_model.pkl"))
 rf_model = safe_load_pickle(os.path.join(MODEL_DIR, "rf_model.pkl"))
-rf_scaler = safe_load_pickle(os.path.join(MODEL_DIR, "scaler.pkl"))  # Scaler for RF and ISO
+rf_scaler = safe_load_pickle(os.path.join(MODEL_DIR, "scaler.pkl"), load_scaler_cached)  # Scaler for RF and ISO
 label_encoder = safe_load_pickle(os.path.join(MODEL_DIR, "label_encoder.pkl"))  # Label encoder for RF
 lstm_scaler = safe_load_pickle(os.path.join(MODEL_DIR, "lstm_scaler.pkl"))
 
@@ -178,12 +185,28 @@ def find_sensor_file():
             return p
     return None
 
-def load_raw_sensor_rows(path):
-    with open(path, "r") as f:
-        raw = json.load(f)
+def _loads_json(data):
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects the NaN/Infinity tokens json.dump writes; retry with
+            # the stdlib parser so accepted files don't depend on orjson
+            pass
+    return json.loads(data)
+
+@lru_cache(maxsize=4)
+def _parse_sensor_file(path, mtime_ns):
+    with open(path, "rb") as f:
+        raw = _loads_json(f.read())
     if not isinstance(raw, list):
         raise ValueError("sensor data JSON must be a list of objects")
-    return raw
+    return tuple(raw)
+
+def load_raw_sensor_rows(path):
+    # Parsed once per file version (keyed by mtime) and shared between
+    # requests, so callers must treat the rows as read-only
+    return _parse_sensor_file(os.path.abspath(path), os.stat(path).st_mtime_ns)
 
 def make_machine_map_from_rows(rows):
     mm = {}
@@ -1114,9 +1137,7 @@ def get_model_metrics():
         try:
             data_path = os.path.join(os.path.dirname(__file__), "sensor_data_3params.json")
             if os.path.exists(data_path):
-                with open(data_path, "r") as f:
-                    data = json.load(f)
-                metrics["training_samples"] = len(data)
+                metrics["training_samples"] = len(load_raw_sensor_rows(data_path))
         except Exception as e:
             print(f"Warning: Could not count training samples: {e}")
         
@@ -1176,33 +1197,7 @@ def manual_analysis():
         vibration_for_models = smooth_vibration
         
         # Prepare features for models using 12 engineered features
-        def create_engineered_features_manual(temp, vib, spd):
-            # Basic features
-            temp_val = float(temp)
-            vib_val = float(vib) 
-            speed_val = float(spd)
-            
-            # Engineered features (using current values as approximations)
-            temp_roll_mean = temp_val
-            temp_roll_std = 0.1
-            temp_trend = 0.0
-            
-            vib_roll_mean = vib_val
-            vib_roll_std = 0.1
-            vib_trend = 0.0
-            
-            speed_roll_mean = speed_val
-            speed_roll_std = 1.0
-            speed_trend = 0.0
-            
-            # Return 12 features in the same order as training
-            return [
-                temp_val, temp_roll_mean, temp_roll_std, temp_trend,
-                vib_val, vib_roll_mean, vib_roll_std, vib_trend,
-                speed_val, speed_roll_mean, speed_roll_std, speed_trend
-            ]
-        
-        features = create_engineered_features_manual(temperature, vibration_for_models, speed)
+        features = create_engineered_features(temperature, vibration_for_models, speed)
         
         # ---------------------------
         # LSTM PREDICTION (Next 5-10 minutes)
@@ -1212,15 +1207,15 @@ def manual_analysis():
             if lstm_model is not None and lstm_scaler is not None:
                 # Create a sequence for LSTM (use current values repeated for sequence)
                 seq_len = 10
-                sequence = np.array([[temperature, vibration_for_models, speed] for _ in range(seq_len)])
+                sequence = np.tile([temperature, vibration_for_models, speed], (seq_len, 1))
                 scaled_seq = lstm_scaler.transform(sequence)
                 
                 with lstm_lock:
                     # Predict next values (5-10 minutes ahead)
-                    pred = lstm_model.predict(scaled_seq.reshape(1, seq_len, 3), verbose=0)[0]
+                    pred = lstm_forward(lstm_model, scaled_seq.reshape(1, seq_len, 3))[0]
                 
                 # Inverse transform to get actual values
-                predicted_values = lstm_scaler.inverse_transform([pred])[0]
+                predicted_values = lstm_scaler.inverse_transform(pred.reshape(1, -1))[0]
                 
                 lstm_prediction = {
                     "temperature": max(0, float(predicted_values[0])),
@@ -1239,6 +1234,7 @@ def manual_analysis():
         # RANDOM FOREST CLASSIFICATION
         # ---------------------------
         rf_result = None
+        features_scaled = None  # scaled once here and reused by Isolation Forest
         try:
             if rf_model is not None and rf_scaler is not None:
                 features_scaled = rf_scaler.transform([features])
@@ -1279,9 +1275,10 @@ def manual_analysis():
         iso_result = None
         try:
             if iso_model is not None and rf_scaler is not None:
-                features_scaled = rf_scaler.transform([features])
-                iso_pred = int(iso_model.predict(features_scaled)[0])
+                if features_scaled is None:
+                    features_scaled = rf_scaler.transform([features])
                 iso_score = float(iso_model.decision_function(features_scaled)[0])
+                iso_pred = iso_label(iso_score)
                 
                 if iso_pred == -1:
                     anomaly_status = "Anomaly Detected"
@@ -1599,37 +1596,6 @@ def analyze_chart():
     latest_speed = max(speed[-10:]) if speed else 0
     latest_vib = max(vib[-10:]) if vib else 0
     
-    # Create engineered features to match training data (12 features total)
-    # Since we only have single values, we'll use them as both current and rolling values
-    def create_engineered_features(temperature, vibration, speed):
-        # Basic features
-        temp_val = float(temperature)
-        vib_val = float(vibration) 
-        speed_val = float(speed)
-        
-        # Engineered features (using current values as approximations)
-        temp_roll_mean = temp_val  # Approximate rolling mean as current value
-        temp_roll_std = 0.1  # Small std deviation as default
-        temp_trend = 0.0  # No trend information available
-        
-        vib_roll_mean = vib_val
-        vib_roll_std = 0.1
-        vib_trend = 0.0
-        
-        speed_roll_mean = speed_val
-        speed_roll_std = 1.0  # Slightly higher std for speed
-        speed_trend = 0.0
-        
-        # Return 12 features in the same order as training:
-        # [temp, temp_roll_mean, temp_roll_std, temp_trend, 
-        #  vib, vib_roll_mean, vib_roll_std, vib_trend,
-        #  speed, speed_roll_mean, speed_roll_std, speed_trend]
-        return [
-            temp_val, temp_roll_mean, temp_roll_std, temp_trend,
-            vib_val, vib_roll_mean, vib_roll_std, vib_trend,
-            speed_val, speed_roll_mean, speed_roll_std, speed_trend
-        ]
-    
     # Create engineered features for model predictions
     latest_for_models = create_engineered_features(latest_temp, latest_vib, latest_speed)
 
@@ -1643,11 +1609,11 @@ def analyze_chart():
             seq_len = 10
             if len(temp) >= seq_len:
                 # Correct order: temperature, vibration, speed (matches training)
-                seq = np.array([[temp[-seq_len + i], vib[-seq_len + i], speed[-seq_len + i]] for i in range(seq_len)])
+                seq = np.column_stack((temp[-seq_len:], vib[-seq_len:], speed[-seq_len:]))
                 scaled = lstm_scaler.transform(seq)
                 with lstm_lock:
-                    pred = lstm_model.predict(scaled.reshape(1, seq_len, 3), verbose=0)[0]
-                inv = lstm_scaler.inverse_transform([pred])[0]
+                    pred = lstm_forward(lstm_model, scaled.reshape(1, seq_len, 3))[0]
+                inv = lstm_scaler.inverse_transform(pred.reshape(1, -1))[0]
                 # Output order: temperature, vibration, speed
                 f_temp = max(0, float(inv[0]))
                 f_vib = max(0, float(inv[1]))
@@ -1670,6 +1636,7 @@ def analyze_chart():
     # ---------------------------
     # RANDOM FOREST (FIXED: Now uses scaling and correct label mapping)
     # ---------------------------
+    features_scaled = None  # scaled once here and reused by Isolation Forest
     try:
         if rf_model is not None and rf_scaler is not None:
             # CRITICAL FIX: Scale features before prediction
@@ -1705,10 +1672,11 @@ def analyze_chart():
     # ---------------------------
     try:
         if iso_model is not None and rf_scaler is not None:
-            # CRITICAL FIX: Scale features before prediction
-            features_scaled = rf_scaler.transform([latest_for_models])
-            iso_pred = int(iso_model.predict(features_scaled)[0])
+            # CRITICAL FIX: Scale features before prediction (unless RF already did)
+            if features_scaled is None:
+                features_scaled = rf_scaler.transform([latest_for_models])
             iso_score = float(iso_model.decision_function(features_scaled)[0])
+            iso_pred = iso_label(iso_score)
             
             if iso_pred == -1:
                 if iso_score < -0.1:
@@ -2172,11 +2140,10 @@ def retrain_and_predict():
             
             # Create sequences for LSTM
             def create_sequences(data, seq_len=10):
-                X, y = [], []
-                for i in range(len(data) - seq_len):
-                    X.append(data[i:i+seq_len])
-                    y.append(data[i+seq_len])
-                return np.array(X), np.array(y)
+                # All seq_len windows except the last, each paired with the
+                # row that follows it, copied once into (samples, seq_len, features)
+                windows = sliding_window_view(data, seq_len, axis=0)[:-1]
+                return windows.transpose(0, 2, 1).astype(np.float32), data[seq_len:].astype(np.float32)
             
             SEQ_LEN = 10
             if len(scaled_data) <= SEQ_LEN:
@@ -2225,15 +2192,15 @@ def retrain_and_predict():
             
             # Create sequence for prediction
             seq_len = 10
-            sequence = np.array([current_values for _ in range(seq_len)])
+            sequence = np.tile(current_values, (seq_len, 1))
             scaled_seq = lstm_scaler.transform(sequence)
             
             with lstm_lock:
                 # Predict next values (5-10 minutes ahead)
-                pred = lstm_model.predict(scaled_seq.reshape(1, seq_len, 3), verbose=0)[0]
+                pred = lstm_forward(lstm_model, scaled_seq.reshape(1, seq_len, 3))[0]
             
             # Inverse transform to get actual values
-            predicted_values = lstm_scaler.inverse_transform([pred])[0]
+            predicted_values = lstm_scaler.inverse_transform(pred.reshape(1, -1))[0]
             
             enhanced_prediction = {
                 "temperature": max(0, float(predicted_values[0])),
@@ -2242,25 +2209,33 @@ def retrain_and_predict():
             }
             
             # Generate multiple future predictions (next 30 minutes in 5-minute intervals)
-            future_predictions = []
+            future_steps = 6  # 6 steps = 30 minutes
+            scaled_steps = np.empty((future_steps, 3), dtype=pred.dtype)
             current_seq = scaled_seq.reshape(seq_len, 3)
             
-            for step in range(6):  # 6 steps = 30 minutes
-                with lstm_lock:
-                    next_pred = lstm_model.predict(current_seq.reshape(1, seq_len, 3), verbose=0)[0]
-                
-                # Inverse transform
-                next_values = lstm_scaler.inverse_transform([next_pred])[0]
+            for step in range(future_steps):
+                if step == 0:
+                    # First window is scaled_seq itself, already predicted above
+                    next_pred = pred
+                else:
+                    with lstm_lock:
+                        next_pred = lstm_forward(lstm_model, current_seq.reshape(1, seq_len, 3))[0]
+                scaled_steps[step] = next_pred
                 
-                future_predictions.append({
+                # Update sequence for next prediction
+                current_seq = np.vstack([current_seq[1:], next_pred.reshape(1, 3)])
+            
+            # Inverse transform all steps in one scaler call
+            future_values = lstm_scaler.inverse_transform(scaled_steps)
+            future_predictions = [
+                {
                     "time_offset": f"+{(step + 1) * 5} min",
                     "temperature": max(0, float(next_values[0])),
                     "vibration": max(0, float(next_values[1])),
                     "speed": max(0, float(next_values[2]))
-                })
-                
-                # Update sequence for next prediction
-                current_seq = np.vstack([current_seq[1:], next_pred.reshape(1, 3)])
+                }
+                for step, next_values in enumerate(future_values)
+            ]
             
         except Exception as e:
             return jsonify({
@@ -2274,38 +2249,14 @@ def retrain_and_predict():
         try:
             # Run enhanced analysis with the retrained model
             # Create engineered features to match training data (12 features total)
-            def create_engineered_features_for_analysis(temp, vib, spd):
-                # Basic features
-                temp_val = float(temp)
-                vib_val = float(vib) 
-                speed_val = float(spd)
-                
-                # Engineered features (using current values as approximations)
-                temp_roll_mean = temp_val
-                temp_roll_std = 0.1
-                temp_trend = 0.0
-                
-                vib_roll_mean = vib_val
-                vib_roll_std = 0.1
-                vib_trend = 0.0
-                
-                speed_roll_mean = speed_val
-                speed_roll_std = 1.0
-                speed_trend = 0.0
-                
-                # Return 12 features in the same order as training
-                return [
-                    temp_val, temp_roll_mean, temp_roll_std, temp_trend,
-                    vib_val, vib_roll_mean, vib_roll_std, vib_trend,
-                    speed_val, speed_roll_mean, speed_roll_std, speed_trend
-                ]
+            features_for_analysis = create_engineered_features(temperature, vibration_for_models, speed)
             
-            features_for_analysis = create_engineered_features_for_analysis(temperature, vibration_for_models, speed)
+            # RF and ISO share the same scaled feature row
+            features_scaled = rf_scaler.transform([features_for_analysis]) if rf_scaler is not None else None
             
             # Random Forest Analysis (if available)
             rf_result = None
             if rf_model is not None and rf_scaler is not None:
-                features_scaled = rf_scaler.transform([features_for_analysis])
                 rf_pred = int(rf_model.predict(features_scaled)[0])
                 
                 if rf_pred == 0:
@@ -2331,9 +2282,8 @@ def retrain_and_predict():
             # Isolation Forest Analysis (if available)
             iso_result = None
             if iso_model is not None and rf_scaler is not None:
-                features_scaled = rf_scaler.transform([features_for_analysis])
-                iso_pred = int(iso_model.predict(features_scaled)[0])
                 iso_score = float(iso_model.decision_function(features_scaled)[0])
+                iso_pred = iso_label(iso_score)
                 
                 if iso_pred == -1:
                     anomaly_status = "Anomaly Detected"
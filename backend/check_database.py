@@ -10,6 +10,12 @@ sys.path.append(os.path.dirname(__file__))
 from app import app, db
 from sqlalchemy import text
 
+# Columns added by the machine management migration, in report order
+REQUIRED_COLUMNS = (
+    'motor_type', 'motor_id', 'date_of_purchase',
+    'purpose', 'user_id', 'approved_at', 'approved_by'
+)
+
 def check_database_status():
     """Check current database status and recommend migration approach"""
     
@@ -33,12 +39,8 @@ def check_database_status():
                 print(f"   - {col}")
             
             # Check for new columns
-            required_columns = [
-                'motor_type', 'motor_id', 'date_of_purchase', 
-                'purpose', 'user_id', 'approved_at', 'approved_by'
-            ]
-            
-            missing_columns = [col for col in required_columns if col not in existing_columns]
+            present_columns = set(existing_columns)
+            missing_columns = [col for col in REQUIRED_COLUMNS if col not in present_columns]
             
             if missing_columns:
                 print(f"\n❌ Missing columns: {', '.join(missing_columns)}")
@@ -6,6 +6,14 @@ Run: python clean_sensor_data.py
 
 import json
 import os
+import sys
+import time
+from array import array
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder/decoder
+    orjson = None
 
 def clean_sensor_data():
     print("=" * 60)
@@ -15,8 +23,19 @@ def clean_sensor_data():
     # Read original data
     json_path = os.path.join(os.path.dirname(__file__), "sensor_data_3params.json")
     
-    with open(json_path, 'r') as f:
-        data = json.load(f)
+    with open(json_path, 'rb') as f:
+        raw = f.read()
+    # orjson rejects the NaN/Infinity tokens json.dump writes; such files go
+    # through the stdlib parser and encoder so they round-trip the same whether
+    # or not orjson is installed
+    use_orjson = orjson is not None
+    if use_orjson:
+        try:
+            data = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            use_orjson = False
+    if not use_orjson:
+        data = json.loads(raw)
     
     print(f"\n📁 Loaded {len(data)} records")
     
@@ -65,14 +84,18 @@ def clean_sensor_data():
     # Save cleaned data
     backup_path = json_path.replace(".json", "_backup.json")
     
-    # Create backup
-    with open(backup_path, 'w') as f:
-        json.dump(data, f, indent=2)
+    # Create backup from the bytes as read (records above were fixed in place)
+    with open(backup_path, 'wb') as f:
+        f.write(raw)
     print(f"✅ Backup saved to: {backup_path}")
     
     # Save cleaned data
-    with open(json_path, 'w') as f:
-        json.dump(cleaned_data, f, indent=2)
+    if use_orjson:
+        with open(json_path, 'wb') as f:
+            f.write(orjson.dumps(cleaned_data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(json_path, 'w') as f:
+            json.dump(cleaned_data, f, indent=2)
     print(f"✅ Cleaned data saved to: {json_path}")
     
     # Verify cleaned data
@@ -82,7 +105,8 @@ def clean_sensor_data():
     for record in cleaned_data:
         mid = record.get("machine_id", "Unknown")
         if mid not in machines:
-            machines[mid] = {"temperature": [], "vibration": [], "speed": []}
+            # array('d') keeps raw doubles contiguous instead of boxed floats
+            machines[mid] = {"temperature": array('d'), "vibration": array('d'), "speed": array('d')}
         
         machines[mid]["temperature"].append(record.get("temperature"))
         machines[mid]["vibration"].append(record.get("vibration"))
@@ -106,9 +130,18 @@ def clean_sensor_data():
     print("\n🎉 You can now restart the backend and charts will show correct data!")
 
 if __name__ == "__main__":
+    ok = False
+    t0 = time.perf_counter()
     try:
         clean_sensor_data()
+        ok = True
     except Exception as e:
         print(f"\n❌ Cleaning failed: {e}")
-        import traceback
-        traceback.print_exc()
+        if os.environ.get("DEBUG") == "1":
+            import traceback
+            traceback.print_exc()
+    finally:
+        print(json.dumps({"task": "clean_sensor_data", "ok": ok,
+                          "elapsed_s": round(time.perf_counter() - t0, 4)}))
+    if not ok:
+        sys.exit(1)
@@ -135,20 +135,26 @@ STANDARDS_INFO = {
 }
 
 if __name__ == "__main__":
+    import io
+    import sys
+    
+    # Collect the report in memory and write it once at the end
+    out = io.StringIO()
+    
     # Test the industrial standards functions
-    print("🏭 Testing Industrial Standards Module")
-    print("=" * 50)
+    print("🏭 Testing Industrial Standards Module", file=out)
+    print("=" * 50, file=out)
     
     # Display standards information
-    print("\n📋 Industry Standards Reference:")
+    print("\n📋 Industry Standards Reference:", file=out)
     for param, info in STANDARDS_INFO.items():
-        print(f"\n{param.upper()}:")
-        print(f"  Standard: {info['standard']}")
-        print(f"  Description: {info['description']}")
-        print(f"  Reference: {info['reference']}")
+        print(f"\n{param.upper()}:", file=out)
+        print(f"  Standard: {info['standard']}", file=out)
+        print(f"  Description: {info['description']}", file=out)
+        print(f"  Reference: {info['reference']}", file=out)
     
-    print("\n" + "=" * 50)
-    print("🧪 Test Classifications:")
+    print("\n" + "=" * 50, file=out)
+    print("🧪 Test Classifications:", file=out)
     
     # Test cases
     test_cases = [
@@ -160,12 +166,14 @@ if __name__ == "__main__":
     
     for temp, vib, speed, description in test_cases:
         analysis = get_detailed_analysis(temp, vib, speed)
-        print(f"\n{description}:")
-        print(f"  Values: T={temp}°C, V={vib}mm/s, S={speed}RPM")
-        print(f"  Overall: {analysis['overall_condition'].upper()}")
-        print(f"  Temperature: {analysis['temperature']['condition']} ({analysis['temperature']['standard']})")
-        print(f"  Vibration: {analysis['vibration']['condition']} ({analysis['vibration']['standard']})")
-        print(f"  Speed: {analysis['speed']['condition']} ({analysis['speed']['standard']})")
-    
-    print(f"\n{'=' * 50}")
-    print("✅ Industrial standards module working correctly!")
\ No newline at end of file
+        print(f"\n{description}:", file=out)
+        print(f"  Values: T={temp}°C, V={vib}mm/s, S={speed}RPM", file=out)
+        print(f"  Overall: {analysis['overall_condition'].upper()}", file=out)
+        print(f"  Temperature: {analysis['temperature']['condition']} ({analysis['temperature']['standard']})", file=out)
+        print(f"  Vibration: {analysis['vibration']['condition']} ({analysis['vibration']['standard']})", file=out)
+        print(f"  Speed: {analysis['speed']['condition']} ({analysis['speed']['standard']})", file=out)
+    
+    print(f"\n{'=' * 50}", file=out)
+    print("✅ Industrial standards module working correctly!", file=out)
+    
+    sys.stdout.write(out.getvalue())
@@ -3,9 +3,9 @@ import json
 import pickle
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 import tensorflow as tf
 from sklearn.preprocessing import MinMaxScaler
-from sklearn.metrics import mean_absolute_error, mean_squared_error
 from tensorflow.keras.models import Sequential # type: ignore
 from tensorflow.keras.layers import LSTM, Dense, Dropout # type: ignore
 from tensorflow.keras.callbacks import EarlyStopping, ReduceLROnPlateau, ModelCheckpoint # type: ignore
@@ -34,9 +34,19 @@ print("🚀 Starting Perfect LSTM Training...")
 with open(DATA_PATH, "r") as f:
     data = json.load(f)
 
-df = pd.DataFrame(data)
+# Pull only the columns we train on: the readings go straight into one
+# structured float64 buffer (missing values -> NaN) instead of a DataFrame
+# built from every field of every record
+READING_DTYPE = np.dtype([(feature, "f8") for feature in FEATURES])
+readings = np.fromiter(
+    (tuple(np.nan if row.get(feature) is None else row[feature] for feature in FEATURES) for row in data),
+    dtype=READING_DTYPE,
+    count=len(data),
+)
+df = pd.DataFrame({"timestamp": [row.get("timestamp") for row in data]})
+for feature in FEATURES:
+    df[feature] = readings[feature]
 df = df.sort_values("timestamp").reset_index(drop=True)
-df[FEATURES] = df[FEATURES].astype(float)
 df = df.dropna(subset=FEATURES)
 
 print("✅ Data loaded:", df.shape)
@@ -83,11 +93,10 @@ with open(os.path.join(MODEL_DIR, "scaler_y.pkl"), "wb") as f:
 # CREATE SEQUENCES
 # ---------------------------
 def create_sequences(X, y, seq_len=15):
-    Xs, ys = [], []
-    for i in range(seq_len, len(X)):
-        Xs.append(X[i - seq_len : i])
-        ys.append(y[i])  # predict next step
-    return np.array(Xs), np.array(ys)
+    # Window X[i - seq_len : i] predicts y[i] (next step); the strided view
+    # is copied once into a contiguous (samples, seq_len, features) array
+    windows = sliding_window_view(X, seq_len, axis=0)[:-1]
+    return windows.transpose(0, 2, 1).astype(np.float32), y[seq_len:].astype(np.float32)
 
 X, y = create_sequences(X_scaled, y_scaled, SEQ_LEN)
 print("✅ Sequence created:", X.shape, y.shape)
@@ -198,16 +207,30 @@ best_model = tf.keras.models.load_model(os.path.join(MODEL_DIR, "best_model.kera
 y_pred_scaled = best_model.predict(X_test, verbose=0)
 
 y_pred = scaler_y.inverse_transform(y_pred_scaled)
-y_true = scaler_y.inverse_transform(y_test)
-
-mae = mean_absolute_error(y_true, y_pred)
-rmse = np.sqrt(mean_squared_error(y_true, y_pred))
-mape = np.mean(np.abs((y_true - y_pred) / np.maximum(np.abs(y_true), 1e-8))) * 100
+# Test targets in original units straight from the data (y[i] is row i + SEQ_LEN),
+# so only the predictions need to go back through the scaler
+y_true = df[FEATURES].values[SEQ_LEN + val_end:]
+
+# Per-feature metrics as axis-0 reductions over one error array; the
+# overall figures are the uniform average across features
+err = y_true - y_pred
+sq_err = np.square(err).mean(axis=0)
+mae_per = np.abs(err).mean(axis=0)
+rmse_per = np.sqrt(sq_err)
+mape_per = np.abs(err / np.maximum(np.abs(y_true), 1e-8)).mean(axis=0) * 100
+ss_tot = np.square(y_true - y_true.mean(axis=0)).mean(axis=0)
+r2_per = 1 - np.divide(sq_err, ss_tot, out=np.ones_like(ss_tot), where=ss_tot != 0)
+
+mae = mae_per.mean()
+rmse = np.sqrt(sq_err.mean())
+mape = mape_per.mean()
 
 print("\n📌 TEST METRICS (REAL):")
 print(f"✅ MAE  : {mae:.4f}")
 print(f"✅ RMSE : {rmse:.4f}")
 print(f"✅ MAPE : {mape:.2f}%")
+for name, f_mae, f_rmse, f_mape, f_r2 in zip(FEATURES, mae_per, rmse_per, mape_per, r2_per):
+    print(f"   {name:<12} MAE {f_mae:.4f} | RMSE {f_rmse:.4f} | MAPE {f_mape:.2f}% | R² {f_r2:.4f}")
 
 print("\n💾 Saved files:")
 print("✔ best_model.keras")
@@ -1,6 +1,6 @@
 # train_models.py (Improved High Accuracy)
 import os
-import pickle
+import joblib
 import numpy as np
 import pandas as pd
 
@@ -19,6 +19,15 @@ FEATURES = ["temperature", "vibration", "speed"]
 
 os.makedirs(MODEL_DIR, exist_ok=True)
 
+def save_model_file(name, write):
+    # Write to a temp file and swap it in, so a running API never reads a
+    # half-written model and keeps its already-loaded copy intact
+    path = os.path.join(MODEL_DIR, name)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        write(f)
+    os.replace(tmp_path, path)
+
 # ----------------------------
 # 1) Load dataset
 # ----------------------------
@@ -42,14 +51,13 @@ print("✅ Data loaded:", df.shape)
 # ----------------------------
 # 3) Auto-generate labels (your logic)
 # ----------------------------
-def classify_row(row):
-    score = 0
-    if row["temperature"] > 75: score += 1
-    if row["vibration"] > 5: score += 1
-    if row["speed"] > 1500: score += 1
-    return "critical" if score >= 2 else "warning" if score == 1 else "normal"
-
-df["condition"] = df.apply(classify_row, axis=1)
+# one point per parameter over its limit, computed on whole columns at once
+score = (
+    (df["temperature"].to_numpy(float) > 75).astype(np.int8)
+    + (df["vibration"].to_numpy(float) > 5)
+    + (df["speed"].to_numpy(float) > 1500)
+)
+df["condition"] = np.select([score >= 2, score == 1], ["critical", "warning"], default="normal")
 
 # ----------------------------
 # 4) Feature Engineering (VERY IMPORTANT for near 100%)
@@ -80,8 +88,7 @@ X = df[engineered_features].values.astype(float)
 le = LabelEncoder()
 y = le.fit_transform(df["condition"])
 
-with open(os.path.join(MODEL_DIR, "label_encoder.pkl"), "wb") as f:
-    pickle.dump(le, f)
+save_model_file("label_encoder.pkl", lambda f: joblib.dump(le, f))
 print("✔ label_encoder.pkl saved.")
 
 # ----------------------------
@@ -98,13 +105,19 @@ X_train, X_test, y_train, y_test = train_test_split(
 # 7) Scaling
 # ----------------------------
 scaler = StandardScaler()
-X_train_scaled = scaler.fit_transform(X_train)
-X_test_scaled  = scaler.transform(X_test)
+# Tree ensembles work in float32 internally; casting once here saves every
+# fit/predict inside the hyperparameter search from making its own copy
+X_train_scaled = scaler.fit_transform(X_train).astype(np.float32)
+X_test_scaled  = scaler.transform(X_test).astype(np.float32)
 
-with open(os.path.join(MODEL_DIR, "scaler.pkl"), "wb") as f:
-    pickle.dump(scaler, f)
+save_model_file("scaler.pkl", lambda f: joblib.dump(scaler, f))
 print("✔ scaler.pkl saved.")
 
+# Plain-array copy of the scaler parameters; the API loads this instead of
+# unpickling a StandardScaler when it is present
+save_model_file("scaler.npz", lambda f: np.savez(f, mean=scaler.mean_, scale=scaler.scale_))
+print("✔ scaler.npz saved.")
+
 # ----------------------------
 # 8) Class Weights (handles imbalance)
 # ----------------------------
@@ -143,8 +156,7 @@ search.fit(X_train_scaled, y_train)
 best_rf = search.best_estimator_
 print("\n✅ Best RF Parameters:", search.best_params_)
 
-with open(os.path.join(MODEL_DIR, "rf_model.pkl"), "wb") as f:
-    pickle.dump(best_rf, f)
+save_model_file("rf_model.pkl", lambda f: joblib.dump(best_rf, f))
 print("✔ rf_model.pkl saved.")
 
 # ----------------------------
@@ -157,22 +169,40 @@ contamination = float(np.clip(critical_ratio, 0.01, 0.10))
 iso = IsolationForest(
     contamination=contamination,
     random_state=42,
-    n_estimators=300
+    n_estimators=300,
+    n_jobs=-1
 )
 
-iso.fit(scaler.transform(X))  # use full dataset scaled
+X_scaled = scaler.transform(X).astype(np.float32)
+iso.fit(X_scaled)  # use full dataset scaled
 
-with open(os.path.join(MODEL_DIR, "iso_model.pkl"), "wb") as f:
-    pickle.dump(iso, f)
+save_model_file("iso_model.pkl", lambda f: joblib.dump(iso, f))
 print(f"✔ iso_model.pkl saved. (contamination={contamination:.3f})")
 
+# Score distribution in the API's severity buckets (critical < -0.1 <= high < -0.05),
+# counted in a single pass; predict() flags a sample as -1 when its score is < 0
+iso_scores = iso.decision_function(X_scaled)
+critical_count, high_count, other_count = np.bincount(
+    np.searchsorted([-0.1, -0.05], iso_scores, side="right"), minlength=3
+)
+print(f"   anomaly rate {(iso_scores < 0).mean():.3%} | "
+      f"critical {critical_count} | high {high_count} | other {other_count}")
+
 # ----------------------------
 # 11) Evaluation
 # ----------------------------
 y_pred = best_rf.predict(X_test_scaled)
 
+cm = confusion_matrix(y_test, y_pred, labels=np.arange(len(le.classes_)))
 print("\n📊 Confusion Matrix:\n")
-print(confusion_matrix(y_test, y_pred))
+print(cm)
+
+# Overall and per-class accuracy straight from the matrix (diagonal / row totals)
+class_totals = cm.sum(axis=1)
+per_class = np.divide(np.diag(cm), class_totals, out=np.zeros(len(class_totals)), where=class_totals != 0)
+print(f"\n✅ Test accuracy: {cm.trace() / cm.sum():.4f}")
+for name, acc in zip(le.classes_, per_class):
+    print(f"   {name:<10} {acc:.4f}")
 
 print("\n📊 Classification Report:\n")
 print(classification_report(y_test, y_pred, target_names=le.classes_))
@@ -1,9 +1,49 @@
 # reasoning_engine.py - ChatGPT-Level Intelligent Machine Health Reasoning Engine
 import numpy as np
+from collections import namedtuple
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 import re
 
+_PARAMETERS = ("temperature", "vibration", "speed")
+
+# Per-parameter statistics shared by the current-state and trend analysis
+_SeriesStats = namedtuple("_SeriesStats", "count current mean max min volatility slope")
+
+def _series_stats(values):
+    """Summary statistics for a NaN-free float64 series with at least one value."""
+    n = values.shape[0]
+    recent = values[-10:]
+    volatility = recent.std() if n >= 10 else 0.0
+    # Least-squares slope over the last 20 points (same as np.polyfit(x, y, 1)[0])
+    window = values[-20:]
+    x = np.arange(window.shape[0]) - (window.shape[0] - 1) / 2.0
+    denom = (x * x).sum()
+    slope = (x * (window - window.mean())).sum() / denom if denom > 0 else 0.0
+    return n, values[-1], recent.mean(), recent.max(), recent.min(), volatility, slope
+
+# Question intents in priority order; each keyword list is compiled once into a
+# single alternation so intent detection is one regex scan per intent rather
+# than a Python-level substring check per keyword
+_INTENT_KEYWORDS = (
+    ("temperature", ["temperature", "temp", "hot", "heat", "overheat", "cooling", "thermal", "cold", "warm"]),
+    ("vibration", ["vibration", "vibrate", "shake", "shaking", "mechanical", "bearing", "alignment", "balance"]),
+    ("speed", ["speed", "rpm", "fast", "slow", "motor", "rotation", "velocity"]),
+    ("anomaly", ["anomaly", "abnormal", "unusual", "strange", "weird", "wrong", "issue", "problem", "error"]),
+    ("forecast", ["forecast", "predict", "future", "next", "will", "going to", "expect", "anticipate"]),
+    ("risk", ["risk", "failure", "fail", "breakdown", "danger", "safe", "critical", "emergency"]),
+    ("recommendation", ["recommend", "suggest", "should", "what to do", "action", "fix", "solve", "help", "repair"]),
+    ("health", ["health", "status", "condition", "how is", "overall", "summary", "report", "state"]),
+    ("trend", ["trend", "trending", "pattern", "changing", "increasing", "decreasing", "rising", "falling"]),
+    ("why", ["why", "explain", "reason", "cause", "because", "how come"]),
+    ("comparison", ["compare", "difference", "vs", "versus", "between", "which"]),
+    ("correlation", ["correlation", "related", "connection", "relationship", "linked"]),
+)
+_INTENT_PATTERNS = tuple(
+    (intent, re.compile("|".join(map(re.escape, keywords))))
+    for intent, keywords in _INTENT_KEYWORDS
+)
+
 class MachineHealthReasoner:
     """
     Advanced AI reasoning engine with ChatGPT-level intelligence that analyzes 
@@ -61,17 +101,26 @@ class MachineHealthReasoner:
                 "sensor_snapshot": {k: v[-1] if v else 0 for k, v in sensor_data.items()}
             })
         
+        # Convert each series to a float64 array once; the helpers below work
+        # on these arrays instead of re-filtering the raw lists
+        series = {
+            param: np.asarray(sensor_data.get(param, []), dtype=np.float64)
+            for param in _PARAMETERS
+        }
+        clean = {param: values[~np.isnan(values)] for param, values in series.items()}
+        stats = self._summarize(clean)
+        
         # Extract current state with enhanced statistics
-        current_state = self._extract_current_state(sensor_data)
+        current_state = self._extract_current_state(stats)
         
         # Extract trends with predictive analysis
-        trends = self._analyze_trends(sensor_data)
+        trends = self._analyze_trends(stats)
         
         # Interpret ML outputs with deep insights
         ml_interpretation = self._interpret_ml_outputs(ml_outputs, current_state)
         
         # Detect anomalies and patterns with root cause analysis
-        anomalies = self._detect_anomalies(sensor_data, ml_outputs)
+        anomalies = self._detect_anomalies(series, clean, ml_outputs)
         
         # Advanced risk assessment with failure probability
         risk_assessment = self._assess_risk(current_state, trends, ml_interpretation, anomalies)
@@ -80,7 +129,7 @@ class MachineHealthReasoner:
         recommendations = self._generate_recommendations(risk_assessment, current_state, trends)
         
         # Detect correlations between parameters
-        correlations = self._analyze_correlations(sensor_data)
+        correlations = self._analyze_correlations(series)
         
         # Build natural language response with context awareness
         response = self._build_response(
@@ -111,24 +160,19 @@ class MachineHealthReasoner:
             "correlations": correlations
         }
     
-    def _extract_current_state(self, sensor_data: Dict[str, List[float]]) -> Dict[str, Any]:
+    def _summarize(self, clean: Dict[str, np.ndarray]) -> Dict[str, _SeriesStats]:
+        """Compute summary statistics for every non-empty cleaned series"""
+        return {
+            param: _SeriesStats(*_series_stats(values))
+            for param, values in clean.items() if values.size
+        }
+    
+    def _extract_current_state(self, stats: Dict[str, _SeriesStats]) -> Dict[str, Any]:
         """Extract current sensor values and their status"""
         state = {}
         
-        for param in ["temperature", "vibration", "speed"]:
-            values = sensor_data.get(param, [])
-            if not values:
-                continue
-                
-            # Clean data
-            clean_values = [v for v in values if not np.isnan(v) and v is not None]
-            if not clean_values:
-                continue
-            
-            current = clean_values[-1]
-            recent_avg = np.mean(clean_values[-10:]) if len(clean_values) >= 10 else np.mean(clean_values)
-            recent_max = np.max(clean_values[-10:]) if len(clean_values) >= 10 else np.max(clean_values)
-            recent_min = np.min(clean_values[-10:]) if len(clean_values) >= 10 else np.min(clean_values)
+        for param, param_stats in stats.items():
+            current = param_stats.current
             
             # Determine status using industry standards
             status = self.check_threshold_status(param, current)
@@ -144,35 +188,28 @@ class MachineHealthReasoner:
             
             state[param] = {
                 "current": float(current),
-                "recent_avg": float(recent_avg),
-                "recent_max": float(recent_max),
-                "recent_min": float(recent_min),
+                "recent_avg": float(param_stats.mean),
+                "recent_max": float(param_stats.max),
+                "recent_min": float(param_stats.min),
                 "status": internal_status,  # Use mapped status for compatibility
                 "industry_status": status,   # Store original industry standard status
-                "volatility": float(np.std(clean_values[-10:])) if len(clean_values) >= 10 else 0.0
+                "volatility": float(param_stats.volatility)
             }
         
         return state
     
-    def _analyze_trends(self, sensor_data: Dict[str, List[float]]) -> Dict[str, Any]:
+    def _analyze_trends(self, stats: Dict[str, _SeriesStats]) -> Dict[str, Any]:
         """Analyze trends in sensor data"""
         trends = {}
         
-        for param in ["temperature", "vibration", "speed"]:
-            values = sensor_data.get(param, [])
-            if not values or len(values) < 3:
-                trends[param] = {"direction": "unknown", "strength": 0, "description": "Insufficient data"}
-                continue
-            
-            clean_values = [v for v in values if not np.isnan(v) and v is not None]
-            if len(clean_values) < 3:
+        for param in _PARAMETERS:
+            param_stats = stats.get(param)
+            if param_stats is None or param_stats.count < 3:
                 trends[param] = {"direction": "unknown", "strength": 0, "description": "Insufficient data"}
                 continue
             
-            # Calculate trend using linear regression on recent data
-            recent = clean_values[-20:] if len(clean_values) >= 20 else clean_values
-            x = np.arange(len(recent))
-            slope = np.polyfit(x, recent, 1)[0]
+            # Trend is the linear regression slope over the last 20 readings
+            slope = param_stats.slope
             
             # Determine direction and strength
             if abs(slope) < 0.1:
@@ -288,23 +325,20 @@ class MachineHealthReasoner:
         
         return interpretation
     
-    def _detect_anomalies(self, sensor_data: Dict[str, List[float]], ml_outputs: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _detect_anomalies(self, series: Dict[str, np.ndarray], clean: Dict[str, np.ndarray],
+                          ml_outputs: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Detect specific anomalies and patterns"""
         anomalies = []
         
         # Check for sudden spikes
-        for param in ["temperature", "vibration", "speed"]:
-            values = sensor_data.get(param, [])
-            if len(values) < 5:
-                continue
-            
-            clean_values = [v for v in values if not np.isnan(v) and v is not None]
+        for param in _PARAMETERS:
+            clean_values = clean[param]
             if len(clean_values) < 5:
                 continue
             
             recent = clean_values[-5:]
-            avg = np.mean(recent[:-1])
-            current = recent[-1]
+            avg = float(recent[:-1].mean())
+            current = float(recent[-1])
             
             # Detect spike (>30% increase)
             if current > avg * 1.3:
@@ -327,14 +361,14 @@ class MachineHealthReasoner:
                 })
         
         # Check for correlated issues
-        temp_values = sensor_data.get("temperature", [])
-        vib_values = sensor_data.get("vibration", [])
+        temp_values = series["temperature"]
+        vib_values = series["vibration"]
         
-        if temp_values and vib_values and len(temp_values) >= 5 and len(vib_values) >= 5:
-            temp_clean = [v for v in temp_values[-5:] if not np.isnan(v)]
-            vib_clean = [v for v in vib_values[-5:] if not np.isnan(v)]
+        if len(temp_values) >= 5 and len(vib_values) >= 5:
+            temp_clean = temp_values[-5:][~np.isnan(temp_values[-5:])]
+            vib_clean = vib_values[-5:][~np.isnan(vib_values[-5:])]
             
-            if temp_clean and vib_clean:
+            if temp_clean.size and vib_clean.size:
                 # Use industry standard thresholds for correlation detection
                 if (temp_clean[-1] > self.thresholds["temperature"]["unsatisfactory"] and 
                     vib_clean[-1] > self.thresholds["vibration"]["unsatisfactory"]):
@@ -642,15 +676,16 @@ class MachineHealthReasoner:
         
         return recommendations
     
-    def _analyze_correlations(self, sensor_data: Dict[str, List[float]]) -> Dict[str, Any]:
+    def _analyze_correlations(self, series: Dict[str, np.ndarray]) -> Dict[str, Any]:
         """Analyze correlations between sensor parameters to detect patterns"""
         correlations = {}
         
         try:
             # Get recent data
-            temp = np.array([v for v in sensor_data.get("temperature", [])[-20:] if not np.isnan(v)])
-            vib = np.array([v for v in sensor_data.get("vibration", [])[-20:] if not np.isnan(v)])
-            speed = np.array([v for v in sensor_data.get("speed", [])[-20:] if not np.isnan(v)])
+            temp, vib, speed = (
+                recent[~np.isnan(recent)]
+                for recent in (series[param][-20:] for param in _PARAMETERS)
+            )
             
             min_len = min(len(temp), len(vib), len(speed))
             if min_len < 3:
@@ -746,53 +781,10 @@ class MachineHealthReasoner:
         if not question_lower:
             return "comprehensive"
         
-        # Temperature related
-        if any(word in question_lower for word in ["temperature", "temp", "hot", "heat", "overheat", "cooling", "thermal", "cold", "warm"]):
-            return "temperature"
-        
-        # Vibration related
-        elif any(word in question_lower for word in ["vibration", "vibrate", "shake", "shaking", "mechanical", "bearing", "alignment", "balance"]):
-            return "vibration"
-        
-        # Speed related
-        elif any(word in question_lower for word in ["speed", "rpm", "fast", "slow", "motor", "rotation", "velocity"]):
-            return "speed"
-        
-        # Anomaly related
-        elif any(word in question_lower for word in ["anomaly", "abnormal", "unusual", "strange", "weird", "wrong", "issue", "problem", "error"]):
-            return "anomaly"
-        
-        # Forecast related
-        elif any(word in question_lower for word in ["forecast", "predict", "future", "next", "will", "going to", "expect", "anticipate"]):
-            return "forecast"
-        
-        # Risk related
-        elif any(word in question_lower for word in ["risk", "failure", "fail", "breakdown", "danger", "safe", "critical", "emergency"]):
-            return "risk"
-        
-        # Recommendation related
-        elif any(word in question_lower for word in ["recommend", "suggest", "should", "what to do", "action", "fix", "solve", "help", "repair"]):
-            return "recommendation"
-        
-        # Health/Status related
-        elif any(word in question_lower for word in ["health", "status", "condition", "how is", "overall", "summary", "report", "state"]):
-            return "health"
-        
-        # Trend related
-        elif any(word in question_lower for word in ["trend", "trending", "pattern", "changing", "increasing", "decreasing", "rising", "falling"]):
-            return "trend"
-        
-        # Why/Explanation related
-        elif any(word in question_lower for word in ["why", "explain", "reason", "cause", "because", "how come"]):
-            return "why"
-        
-        # Comparison related
-        elif any(word in question_lower for word in ["compare", "difference", "vs", "versus", "between", "which"]):
-            return "comparison"
-        
-        # Correlation related
-        elif any(word in question_lower for word in ["correlation", "related", "connection", "relationship", "linked"]):
-            return "correlation"
+        # First intent (in priority order) with a keyword in the question wins
+        for intent, pattern in _INTENT_PATTERNS:
+            if pattern.search(question_lower):
+                return intent
         
         # Default comprehensive
         return "comprehensive"
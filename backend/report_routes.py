@@ -2,7 +2,6 @@ from flask import Blueprint, request, jsonify, send_file
 from reportlab.lib.pagesizes import A4
 from reportlab.pdfgen import canvas
 from datetime import datetime
-import pandas as pd
 import os
 
 report_bp = Blueprint("report", __name__)
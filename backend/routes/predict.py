@@ -1,78 +1,130 @@
 # routes/predict.py
 from flask import Blueprint, request, jsonify, current_app
 import numpy as np
-import pandas as pd
 import os
-import pickle
+import joblib
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from keras.models import load_model
 # Import db from the main app context
 from flask import current_app
 # Import MachineData - will be imported when needed to avoid circular imports
 from thresholds import TEMP_THRESHOLDS, VIBRATION_THRESHOLDS, SPEED_THRESHOLDS, check_threshold_status
+from model.feature_utils import create_features_array
 
 predict_bp = Blueprint("predict", __name__)
 
 # These model files live under <project>/model
 MODEL_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "model")
 
-def safe_load_pickle(path):
+@lru_cache(maxsize=None)
+def _unpickle(path):
+    # joblib reads both plain pickles and joblib.dump output. Arrays are loaded
+    # into memory rather than memory-mapped: train_models.py replaces these
+    # files while the API may be running, and a mapped model would change
+    # under it.
+    return joblib.load(path)
+
+def load_pickle_cached(path):
+    # Keyed by absolute path so app.py and this blueprint share one copy of each model
+    return _unpickle(os.path.abspath(path))
+
+class ArrayScaler:
+    """StandardScaler.transform backed by the mean/scale arrays in scaler.npz.
+
+    Output is C-contiguous float32: the scaled rows only feed the RF and
+    IsolationForest models, whose trees cast their input to float32 anyway.
+    """
+
+    def __init__(self, mean, scale):
+        self.mean_ = mean
+        self.scale_ = scale
+        self.n_features_in_ = mean.shape[0]
+        self._mean32 = np.ascontiguousarray(mean, dtype=np.float32)
+        self._scale32 = np.ascontiguousarray(scale, dtype=np.float32)
+
+    def transform(self, X):
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        return (X - self._mean32) / self._scale32
+
+def _is_current(derived_path, source_path):
+    # True if derived_path exists and is no older than source_path
+    try:
+        derived_mtime = os.stat(derived_path).st_mtime_ns
+    except OSError:
+        return False
+    try:
+        return derived_mtime >= os.stat(source_path).st_mtime_ns
+    except OSError:
+        return True
+
+@lru_cache(maxsize=None)
+def _load_scaler(path):
+    # train_models.py writes scaler.npz right after scaler.pkl; reading two
+    # plain arrays skips the pickle VM and the sklearn import. The pickle is
+    # loaded instead when the .npz is missing or older than it, e.g. after a
+    # retrained scaler.pkl was dropped in by hand.
+    npz_path = os.path.splitext(path)[0] + ".npz"
+    if _is_current(npz_path, path):
+        with np.load(npz_path) as params:
+            return ArrayScaler(params["mean"], params["scale"])
+    return _unpickle(path)
+
+def load_scaler_cached(path):
+    return _load_scaler(os.path.abspath(path))
+
+def lstm_forward(model, X):
+    # Call the model directly rather than model.predict(): predict() builds a
+    # tf.data pipeline on every call, which dominates for one (1, seq_len, 3) window
+    return model(np.asarray(X, dtype=np.float32), training=False).numpy()
+
+def iso_label(score):
+    # IsolationForest.predict is decision_function < 0 -> -1, so callers that
+    # already have the score can derive the label without a second pass
+    return -1 if score < 0 else 1
+
+def safe_load_pickle(path, loader=load_pickle_cached):
     try:
-        with open(path, "rb") as f:
-            return pickle.load(f)
+        return loader(path)
     except Exception as e:
         print("Failed to load", path, e)
         return None
 
-# load scalers and models (if not loaded from app)
-scaler = safe_load_pickle(os.path.join(MODEL_DIR, "scaler.pkl"))
-lstm_scaler = safe_load_pickle(os.path.join(MODEL_DIR, "lstm_scaler.pkl"))
-rf_model = safe_load_pickle(os.path.join(MODEL_DIR, "rf_model.pkl"))
-iso_model = safe_load_pickle(os.path.join(MODEL_DIR, "iso_model.pkl"))
-label_encoder = safe_load_pickle(os.path.join(MODEL_DIR, "label_encoder.pkl"))
+# load scalers and models (if not loaded from app). The pickles are read one
+# after another on a single worker thread while the LSTM loads here: unpickling
+# them concurrently races sklearn's own imports and can leave a model as None
+_PICKLE_FILES = (
+    ("scaler.pkl", load_scaler_cached),
+    ("lstm_scaler.pkl", load_pickle_cached),
+    ("rf_model.pkl", load_pickle_cached),
+    ("iso_model.pkl", load_pickle_cached),
+    ("label_encoder.pkl", load_pickle_cached),
+)
 
-lstm_path = os.path.join(MODEL_DIR, "lstm_model.keras")
-lstm_model = None
-if os.path.exists(lstm_path):
-    try:
-        lstm_model = load_model(lstm_path)
-    except Exception as e:
-        print("Failed to load LSTM:", e)
+def _load_pickles():
+    return [safe_load_pickle(os.path.join(MODEL_DIR, name), loader) for name, loader in _PICKLE_FILES]
+
+with ThreadPoolExecutor(max_workers=1) as _pool:
+    _pending = _pool.submit(_load_pickles)
+
+    lstm_path = os.path.join(MODEL_DIR, "lstm_model.keras")
+    lstm_model = None
+    if os.path.exists(lstm_path):
+        try:
+            lstm_model = load_model(lstm_path)
+        except Exception as e:
+            print("Failed to load LSTM:", e)
+
+    scaler, lstm_scaler, rf_model, iso_model, label_encoder = _pending.result()
+
+# Index classes_ directly rather than going through inverse_transform per request
+label_classes = label_encoder.classes_ if label_encoder is not None else None
 
 SEQ_LEN = 10
 
 def feature_row(temp, vib, speed):
-    # Create engineered features to match training data (12 features total)
-    # Since we only have single values, we'll use them as both current and rolling values
-    # This is a simplified approach for real-time prediction
-    
-    # Basic features
-    temperature = float(temp)
-    vibration = float(vib) 
-    speed = float(speed)
-    
-    # Engineered features (using current values as approximations)
-    # In a real system, these would be calculated from historical data
-    temp_roll_mean = temperature  # Approximate rolling mean as current value
-    temp_roll_std = 0.1  # Small std deviation as default
-    temp_trend = 0.0  # No trend information available
-    
-    vib_roll_mean = vibration
-    vib_roll_std = 0.1
-    vib_trend = 0.0
-    
-    speed_roll_mean = speed
-    speed_roll_std = 1.0  # Slightly higher std for speed
-    speed_trend = 0.0
-    
-    # Return 12 features in the same order as training:
-    # [temp, temp_roll_mean, temp_roll_std, temp_trend, 
-    #  vib, vib_roll_mean, vib_roll_std, vib_trend,
-    #  speed, speed_roll_mean, speed_roll_std, speed_trend]
-    return np.array([[
-        temperature, temp_roll_mean, temp_roll_std, temp_trend,
-        vibration, vib_roll_mean, vib_roll_std, vib_trend,
-        speed, speed_roll_mean, speed_roll_std, speed_trend
-    ]])
+    # 12 engineered features matching training, shape (1, 12)
+    return create_features_array(temp, vib, speed)
 
 def model_predict(temp, vib, speed, sequence):
     # Prepare raw feature row and scaled row
@@ -84,7 +136,7 @@ def model_predict(temp, vib, speed, sequence):
     rf_label = None
     try:
         rf_pred = int(rf_model.predict(scaled_row)[0])
-        rf_label = label_encoder.inverse_transform([rf_pred])[0] if label_encoder is not None else rf_pred
+        rf_label = label_classes[rf_pred] if label_classes is not None else rf_pred
     except:
         rf_pred = None
         rf_label = None
@@ -93,8 +145,8 @@ def model_predict(temp, vib, speed, sequence):
     iso_pred = None
     iso_score = None
     try:
-        iso_pred = int(iso_model.predict(scaled_row)[0])
         iso_score = float(iso_model.decision_function(scaled_row)[0])
+        iso_pred = iso_label(iso_score)
     except:
         iso_pred = None
         iso_score = None
@@ -108,7 +160,7 @@ def model_predict(temp, vib, speed, sequence):
                 # We have a proper sequence
                 seq_scaled = lstm_scaler.transform(seq)
                 X = seq_scaled.reshape(1, SEQ_LEN, 3)
-                pred_scaled = lstm_model.predict(X, verbose=0)[0]
+                pred_scaled = lstm_forward(lstm_model, X)[0]
                 pred = lstm_scaler.inverse_transform(pred_scaled.reshape(1,3))[0]
                 f_temp, f_vib, f_speed = float(pred[0]), float(pred[1]), float(pred[2])
             else:
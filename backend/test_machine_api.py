@@ -2,14 +2,50 @@
 """
 Test script for machine management API endpoints.
 Run this after starting the Flask app to test the functionality.
+Pass -v to print full response bodies.
 """
 
+import sys
 import requests
+from requests.adapters import HTTPAdapter
 import json
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; responses then go through requests' own decoder
+    orjson = None
+
 BASE_URL = 'http://localhost:5000'
 
+# Successful response bodies are only printed with -v; errors are always shown
+VERBOSE = '-v' in sys.argv[1:]
+
+# One keep-alive session for every call instead of a new connection per request
+session = requests.Session()
+session.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
+def parse_json(response):
+    if orjson is not None:
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity, which Flask's encoder can emit
+            pass
+    return response.json()
+
+def report_response(response):
+    # Status first, so it is shown even when the body is not JSON
+    print(f"   Status: {response.status_code}")
+    try:
+        result = parse_json(response)
+    except ValueError:
+        print(f"   Response: {response.text}")
+        raise
+    if VERBOSE or not response.ok:
+        print(f"   Response: {json.dumps(result, indent=2)}")
+    return result
+
 def test_machine_management():
     print("🧪 Testing Machine Management API")
     print("=" * 50)
@@ -30,13 +66,12 @@ def test_machine_management():
     
     print("1. Testing Add Machine API...")
     try:
-        response = requests.post(f"{BASE_URL}/api/machines", json=test_machine)
-        print(f"   Status: {response.status_code}")
-        print(f"   Response: {response.json()}")
+        response = session.post(f"{BASE_URL}/api/machines", json=test_machine)
+        result = report_response(response)
         
         if response.status_code == 201:
             print("   ✅ Machine added successfully!")
-            machine_id = response.json().get('machine', {}).get('id')
+            machine_id = result.get('machine', {}).get('id')
         else:
             print("   ❌ Failed to add machine")
             return
@@ -50,12 +85,11 @@ def test_machine_management():
     
     print("\n2. Testing Get User Machines API...")
     try:
-        response = requests.get(f"{BASE_URL}/api/machines?user_email={test_user_email}")
-        print(f"   Status: {response.status_code}")
-        print(f"   Response: {response.json()}")
+        response = session.get(f"{BASE_URL}/api/machines?user_email={test_user_email}")
+        result = report_response(response)
         
         if response.status_code == 200:
-            machines = response.json().get('machines', [])
+            machines = result.get('machines', [])
             print(f"   ✅ Found {len(machines)} machines for user")
         else:
             print("   ❌ Failed to get user machines")
@@ -74,11 +108,11 @@ def test_machine_management():
     
     print("\n4. Testing Get User Machines (Before Approval)...")
     try:
-        response = requests.get(f"{BASE_URL}/api/machines?user_email={test_user_email}")
+        response = session.get(f"{BASE_URL}/api/machines?user_email={test_user_email}")
         print(f"   Status: {response.status_code}")
         
         if response.status_code == 200:
-            machines = response.json().get('machines', [])
+            machines = parse_json(response).get('machines', [])
             approved_machines = [m for m in machines if m.get('status') == 'approved']
             print(f"   ✅ Found {len(approved_machines)} approved machines for user")
             
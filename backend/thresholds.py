@@ -11,6 +11,13 @@ This module defines all threshold values based on international industrial stand
 All components should import and use these values to ensure consistency with industry standards.
 """
 
+from bisect import bisect_right
+from collections import namedtuple
+from enum import IntEnum
+from types import MappingProxyType
+
+import numpy as np
+
 # INDUSTRY STANDARD THRESHOLD VALUES
 # ==================================
 
@@ -56,6 +63,35 @@ ALL_THRESHOLDS = {
 
 CONDITION_LEVELS = ['good', 'satisfactory', 'unsatisfactory', 'unacceptable']
 
+# Row index of each parameter in the THRESHOLD_MIN / THRESHOLD_MAX tables
+Parameter = IntEnum('Parameter', 'temperature vibration speed', start=0)
+
+# Structure-of-arrays copy of ALL_THRESHOLDS: one row per Parameter, one
+# column per CONDITION_LEVELS entry. Lets callers compare whole arrays of
+# readings against a level with a single broadcast instead of dict lookups.
+THRESHOLD_MIN = np.array([
+    [ALL_THRESHOLDS[param.name][level]['min'] for level in CONDITION_LEVELS]
+    for param in Parameter
+])
+THRESHOLD_MAX = np.array([
+    [ALL_THRESHOLDS[param.name][level]['max'] for level in CONDITION_LEVELS]
+    for param in Parameter
+])
+# The tables are shared with _BOUNDARIES below; freeze them so callers cannot
+# change check_threshold_status results by writing to them
+THRESHOLD_MIN.flags.writeable = False
+THRESHOLD_MAX.flags.writeable = False
+
+# Per-parameter views used by check_threshold_status: the upper edge of each
+# level and the lower edge of the 'good' range. Anything outside
+# [lower, last edge) is treated as 'unacceptable'.
+_LOWER_BOUNDS = {param.name: float(THRESHOLD_MIN[param, 0]) for param in Parameter}
+_BOUNDARIES = {param.name: THRESHOLD_MAX[param] for param in Parameter}
+# Plain-float copies of the level edges for scalar lookups: bisect on a tuple
+# avoids NumPy's per-call overhead on a single value
+_EDGES = {param.name: tuple(THRESHOLD_MAX[param].tolist()) for param in Parameter}
+_LEVELS = np.array(CONDITION_LEVELS)
+
 # Mapping to user-friendly terms
 CONDITION_DESCRIPTIONS = {
     'good': {
@@ -92,6 +128,11 @@ CONDITION_DESCRIPTIONS = {
     }
 }
 
+# Read-only view of CONDITION_DESCRIPTIONS used to build status results
+# without copying and then mutating a dict on every call
+_ConditionInfo = namedtuple('ConditionInfo', 'level description priority color icon action')
+_CONDITIONS = {level: _ConditionInfo(**info) for level, info in CONDITION_DESCRIPTIONS.items()}
+
 # HELPER FUNCTIONS
 # ================
 
@@ -138,16 +179,27 @@ def check_threshold_status(parameter, value):
     if parameter not in ALL_THRESHOLDS:
         raise ValueError(f"Unknown parameter: {parameter}")
     
-    thresholds = ALL_THRESHOLDS[parameter]
-    
-    # Check thresholds in order of severity
-    for level in CONDITION_LEVELS:
-        threshold_range = thresholds[level]
-        if threshold_range['min'] <= value < threshold_range['max']:
-            return level
+    return CONDITION_LEVELS[_threshold_code(parameter, value)]
+
+def _threshold_code(parameter, value):
+    """Index into CONDITION_LEVELS for a single value of a known parameter."""
+    # Below the 'good' range matches no level, so return most severe
+    if value < _LOWER_BOUNDS[parameter]:
+        return len(CONDITION_LEVELS) - 1
     
-    # If value exceeds all ranges, return most severe
-    return 'unacceptable'
+    # Binary search over the level upper edges; values past the last edge
+    # (or NaN, which compares false against every edge) clamp to 'unacceptable'
+    return min(bisect_right(_EDGES[parameter], value), len(CONDITION_LEVELS) - 1)
+
+# Parameter, unit and problem summary template for get_overall_status, in the
+# order the details are reported
+_STATUS_READINGS = (
+    ('temperature', '°C', 'Temperature ({:.1f}°C)'),
+    ('vibration', 'mm/s', 'Vibration ({:.1f} mm/s)'),
+    ('speed', 'RPM', 'Speed ({:.0f} RPM)'),
+)
+# First CONDITION_LEVELS index that counts as a problem parameter
+_PROBLEM_CODE = CONDITION_LEVELS.index('unsatisfactory')
 
 def get_overall_status(temp, vibration, speed):
     """
@@ -165,38 +217,80 @@ def get_overall_status(temp, vibration, speed):
         >>> get_overall_status(80.0, 6.0, 1300.0)
         {'level': 'unsatisfactory', 'description': '...', 'priority': 'high', ...}
     """
-    temp_status = check_threshold_status('temperature', temp)
-    vib_status = check_threshold_status('vibration', vibration)
-    speed_status = check_threshold_status('speed', speed)
-    
-    # Get the highest severity level (worst condition)
-    status_priority = {level: i for i, level in enumerate(CONDITION_LEVELS)}
-    statuses = [temp_status, vib_status, speed_status]
-    highest_status = max(statuses, key=lambda x: status_priority[x])
-    
-    # Get description for the worst condition
-    result = CONDITION_DESCRIPTIONS[highest_status].copy()
-    result['details'] = {
-        'temperature': {'value': temp, 'status': temp_status, 'unit': '°C'},
-        'vibration': {'value': vibration, 'status': vib_status, 'unit': 'mm/s'},
-        'speed': {'value': speed, 'status': speed_status, 'unit': 'RPM'}
+    # Classify each parameter, tracking the worst level and collecting the
+    # problematic (unsatisfactory or worse) parameters in the same pass
+    details = {}
+    problem_params = []
+    worst = 0
+    for (parameter, unit, problem), value in zip(_STATUS_READINGS, (temp, vibration, speed)):
+        code = _threshold_code(parameter, value)
+        details[parameter] = {'value': value, 'status': CONDITION_LEVELS[code], 'unit': unit}
+        if code >= _PROBLEM_CODE:
+            problem_params.append(problem.format(value))
+        if code > worst:
+            worst = code
+    
+    # Build the result for the worst condition in one go
+    base = _CONDITIONS[CONDITION_LEVELS[worst]]
+    result = {
+        'level': base.level,
+        'description': base.description,
+        'priority': base.priority,
+        'color': base.color,
+        'icon': base.icon,
+        'action': base.action,
+        'details': details
     }
     
     # Add specific recommendations based on which parameters are problematic
-    problem_params = []
-    if temp_status in ['unsatisfactory', 'unacceptable']:
-        problem_params.append(f"Temperature ({temp:.1f}°C)")
-    if vib_status in ['unsatisfactory', 'unacceptable']:
-        problem_params.append(f"Vibration ({vibration:.1f} mm/s)")
-    if speed_status in ['unsatisfactory', 'unacceptable']:
-        problem_params.append(f"Speed ({speed:.0f} RPM)")
-    
     if problem_params:
         result['problem_parameters'] = problem_params
         result['detailed_action'] = f"Address issues with: {', '.join(problem_params)}"
     
     return result
 
+def _threshold_codes(parameter, values):
+    """Vectorized check_threshold_status returning int8 indexes into CONDITION_LEVELS."""
+    values = np.asarray(values, dtype=float)
+    worst = len(CONDITION_LEVELS) - 1
+    codes = np.searchsorted(_BOUNDARIES[parameter], values, side='right').clip(max=worst)
+    return np.where(values < _LOWER_BOUNDS[parameter], worst, codes).astype(np.int8)
+
+def get_overall_status_batch(temps, vibrations, speeds):
+    """
+    Classify arrays of samples at once using industry standard thresholds.
+    
+    Batch counterpart of get_overall_status for time-series callers. Only the
+    level names are computed here; call get_overall_status on the rows that
+    need the full description and recommendations.
+    
+    Args:
+        temps (array-like): Temperature values in °C
+        vibrations (array-like): Vibration values in mm/s RMS
+        speeds (array-like): Speed values in RPM
+    
+    Returns:
+        dict: Arrays of level names per sample, keyed by 'level' (worst
+              condition) and by 'temperature', 'vibration', 'speed'
+    
+    Example:
+        >>> get_overall_status_batch([65.0, 92.0], [1.5, 6.8], [1180.0, 1380.0])['level']
+        array(['good', 'unsatisfactory'], dtype='<U14')
+    """
+    temp_codes = _threshold_codes('temperature', temps)
+    vib_codes = _threshold_codes('vibration', vibrations)
+    speed_codes = _threshold_codes('speed', speeds)
+    
+    # Levels are ordered by severity, so the worst condition is the max code
+    worst = np.maximum.reduce([temp_codes, vib_codes, speed_codes])
+    
+    return {
+        'level': _LEVELS[worst],
+        'temperature': _LEVELS[temp_codes],
+        'vibration': _LEVELS[vib_codes],
+        'speed': _LEVELS[speed_codes]
+    }
+
 # VALIDATION RANGES (for input validation)
 # ========================================
 
@@ -206,6 +300,9 @@ VALID_RANGES = {
     'speed': {'min': 0.0, 'max': 5000.0}          # RPM - Typical industrial motor range
 }
 
+# (min, max) tuples so validation unpacks once instead of two dict lookups
+_VALID_BOUNDS = {param: (info['min'], info['max']) for param, info in VALID_RANGES.items()}
+
 def validate_parameter(parameter, value):
     """
     Validate if a parameter value is within acceptable range.
@@ -223,39 +320,64 @@ def validate_parameter(parameter, value):
         >>> validate_parameter('vibration', 60.0)
         False
     """
-    if parameter not in VALID_RANGES:
+    bounds = _VALID_BOUNDS.get(parameter)
+    if bounds is None:
         return False
     
-    range_info = VALID_RANGES[parameter]
-    return range_info['min'] <= value <= range_info['max']
+    low, high = bounds
+    return low <= value <= high
+
+def validate_parameter_array(parameter, values):
+    """
+    Validate an array of parameter values against the acceptable range.
+    
+    Args:
+        parameter (str): 'temperature', 'vibration', or 'speed'
+        values (array-like): Values to validate
+    
+    Returns:
+        numpy.ndarray: Boolean mask, True where the value is valid
+    
+    Example:
+        >>> validate_parameter_array('vibration', [5.0, 60.0])
+        array([ True, False])
+    """
+    values = np.asarray(values, dtype=float)
+    bounds = _VALID_BOUNDS.get(parameter)
+    if bounds is None:
+        return np.zeros(values.shape, dtype=bool)
+    
+    low, high = bounds
+    return (values >= low) & (values <= high)
 
 # INDUSTRY STANDARD REFERENCES
 # ============================
 
-STANDARDS_REFERENCE = {
-    'temperature': {
+# Read-only so the shared reference can be handed out without defensive copies
+STANDARDS_REFERENCE = MappingProxyType({
+    'temperature': MappingProxyType({
         'standard': 'NEMA MG-1 / IEC 60034-1',
         'description': 'Class B insulation motor temperature limits',
         'notes': 'Based on 40°C ambient + 90°C rise = 130°C maximum hot spot'
-    },
-    'vibration': {
+    }),
+    'vibration': MappingProxyType({
         'standard': 'ISO 10816-3:2009',
         'description': 'Industrial machinery vibration evaluation',
         'notes': 'For machines >15kW, 120-15000 RPM, rigid foundation, Group 2'
-    },
-    'speed': {
+    }),
+    'speed': MappingProxyType({
         'standard': 'Industry Best Practice',
         'description': 'Typical 4-pole, 60Hz industrial motor operation',
         'notes': 'Synchronous speed 1800 RPM, typical load 1150-1200 RPM'
-    }
-}
+    })
+})
 
 def get_standards_info():
     """
     Get information about the industry standards used for thresholds.
     
     Returns:
-        dict: Standards reference information
+        Mapping: Read-only standards reference information
     """
     return STANDARDS_REFERENCE
 
@@ -269,41 +391,57 @@ __all__ = [
     'ALL_THRESHOLDS',
     'CONDITION_LEVELS',
     'CONDITION_DESCRIPTIONS',
+    'Parameter',
+    'THRESHOLD_MIN',
+    'THRESHOLD_MAX',
     'get_threshold',
     'check_threshold_status',
     'get_overall_status',
+    'get_overall_status_batch',
     'validate_parameter',
+    'validate_parameter_array',
     'get_standards_info',
     'VALID_RANGES',
     'STANDARDS_REFERENCE'
 ]
 
 if __name__ == "__main__":
+    import io
+    import sys
+    
+    # Report line templates, parsed once rather than per loop iteration
+    STANDARD_TEMPLATE = "\n{0}:\n  Standard: {standard}\n  Description: {description}\n  Notes: {notes}"
+    RANGE_TEMPLATE = "  {0}: {min}-{max} {1}"
+    CASE_TEMPLATE = (
+        "\n{0}:\n  Values: T={1}°C, V={2}mm/s, S={3}RPM\n"
+        "  Status: {4} - {description}\n  Priority: {priority}\n  Action: {action}"
+    )
+    ISSUES_TEMPLATE = "  Issues: {}"
+    UNITS = {'temperature': '°C', 'vibration': 'mm/s', 'speed': 'RPM'}
+    
+    # Collect the report in memory and write it once at the end
+    out = io.StringIO()
+    
     # Test the threshold functions with industry standard values
-    print("🧪 Testing Industry Standard Threshold Functions")
-    print("=" * 50)
+    print("🧪 Testing Industry Standard Threshold Functions", file=out)
+    print("=" * 50, file=out)
     
     # Display standards information
-    print("\n📋 Industry Standards Used:")
+    print("\n📋 Industry Standards Used:", file=out)
     for param, info in STANDARDS_REFERENCE.items():
-        print(f"\n{param.upper()}:")
-        print(f"  Standard: {info['standard']}")
-        print(f"  Description: {info['description']}")
-        print(f"  Notes: {info['notes']}")
+        print(STANDARD_TEMPLATE.format(param.upper(), **info), file=out)
     
-    print("\n" + "=" * 50)
-    print("🔍 Threshold Ranges:")
+    print("\n" + "=" * 50, file=out)
+    print("🔍 Threshold Ranges:", file=out)
     
     for param in ['temperature', 'vibration', 'speed']:
-        print(f"\n{param.upper()} Thresholds:")
+        print(f"\n{param.upper()} Thresholds:", file=out)
         thresholds = ALL_THRESHOLDS[param]
         for level in CONDITION_LEVELS:
-            range_info = thresholds[level]
-            unit = '°C' if param == 'temperature' else 'mm/s' if param == 'vibration' else 'RPM'
-            print(f"  {level.capitalize()}: {range_info['min']}-{range_info['max']} {unit}")
+            print(RANGE_TEMPLATE.format(level.capitalize(), UNITS[param], **thresholds[level]), file=out)
     
-    print("\n" + "=" * 50)
-    print("🧪 Test Cases:")
+    print("\n" + "=" * 50, file=out)
+    print("🧪 Test Cases:", file=out)
     
     # Test cases with realistic industrial values
     test_cases = [
@@ -313,15 +451,21 @@ if __name__ == "__main__":
         (115.0, 15.0, 1520.0, "Unacceptable - shutdown")
     ]
     
-    for temp, vib, speed, description in test_cases:
+    # Classify every case in one batch call and check the scalar path agrees
+    temps, vibs, speeds, _ = zip(*test_cases)
+    batch = get_overall_status_batch(temps, vibs, speeds)
+    
+    for i, (temp, vib, speed, description) in enumerate(test_cases):
         status = get_overall_status(temp, vib, speed)
-        print(f"\n{description}:")
-        print(f"  Values: T={temp}°C, V={vib}mm/s, S={speed}RPM")
-        print(f"  Status: {status['level'].upper()} - {status['description']}")
-        print(f"  Priority: {status['priority']}")
-        print(f"  Action: {status['action']}")
+        assert status['level'] == batch['level'][i], (
+            f"{description}: get_overall_status gave {status['level']!r}, "
+            f"get_overall_status_batch gave {batch['level'][i]!r}"
+        )
+        print(CASE_TEMPLATE.format(description, temp, vib, speed, status['level'].upper(), **status), file=out)
         if 'problem_parameters' in status:
-            print(f"  Issues: {', '.join(status['problem_parameters'])}")
+            print(ISSUES_TEMPLATE.format(', '.join(status['problem_parameters'])), file=out)
+    
+    print(f"\n{'=' * 50}", file=out)
+    print("✅ Industry standard thresholds configured successfully!", file=out)
     
-    print(f"\n{'=' * 50}")
-    print("✅ Industry standard thresholds configured successfully!")
\ No newline at end of file
+    sys.stdout.write(out.getvalue())